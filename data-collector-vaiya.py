@@ -1,7 +1,98 @@
 import requests
-import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated downloads reuse pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake on every call
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Parallel Range downloads only pay off for large bodies
+RANGE_WORKERS = 4
+MIN_RANGE_DOWNLOAD_SIZE = 4 * 1024 * 1024
+
+def download_in_ranges(url, filename, workers=RANGE_WORKERS):
+    """
+    Download url into filename using concurrent HTTP Range requests
+    
+    Returns False when the HEAD request fails, the server does not
+    advertise byte ranges, the body is too small to be worth splitting, the
+    server would compress it (one compressed GET moves far fewer bytes than
+    parallel identity ranges), or it gives no validator to pin every range
+    to the same version of the body. Also returns False when any segment
+    fails or does not match what was asked for, so the caller always falls
+    back to a single streamed GET (which overwrites filename).
+    """
+    try:
+        head = _SESSION.head(url, allow_redirects=True, timeout=(5, 30))
+    except requests.exceptions.RequestException:
+        return False
+    size = int(head.headers.get('Content-Length') or 0)
+    if (not head.ok
+            or head.headers.get('Content-Encoding', 'identity') != 'identity'
+            or head.headers.get('Accept-Ranges') != 'bytes'
+            or size < MIN_RANGE_DOWNLOAD_SIZE):
+        return False
+    
+    # If-Range makes the server answer with the full body (200) instead of a
+    # range if the resource changed since the HEAD, so segments can never be
+    # stitched from different versions. Weak ETags are not allowed there.
+    etag = head.headers.get('ETag')
+    validator = etag if etag and not etag.startswith('W/') else head.headers.get('Last-Modified')
+    if not validator:
+        return False
+    
+    # Ranges address the uncompressed bytes, so keep them in identity encoding
+    base_headers = {'Accept-Encoding': 'identity', 'If-Range': validator}
+    
+    # Preallocate the file so every worker can write its segment in place
+    with open(filename, 'wb') as file:
+        file.truncate(size)
+    
+    segment = -(-size // workers)
+    
+    def fetch_segment(start):
+        end = min(start + segment, size) - 1
+        headers = {**base_headers, 'Range': f'bytes={start}-{end}'}
+        with _SESSION.get(url, headers=headers, stream=True, timeout=(5, 30)) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise requests.exceptions.HTTPError(
+                    f"Expected 206 for range {start}-{end}, got {response.status_code}",
+                    response=response
+                )
+            content_range = response.headers.get('Content-Range')
+            if content_range != f'bytes {start}-{end}/{size}':
+                raise requests.exceptions.HTTPError(
+                    f"Unexpected Content-Range {content_range!r} for range {start}-{end}/{size}",
+                    response=response
+                )
+            with open(filename, 'r+b') as file:
+                file.seek(start)
+                shutil.copyfileobj(response.raw, file, length=1 << 20)
+                # urllib3 1.x does not enforce Content-Length, so a dropped
+                # connection can end a segment early without an error
+                written = file.tell() - start
+            if written != end - start + 1:
+                raise requests.exceptions.RequestException(
+                    f"Range {start}-{end} returned {written} of {end - start + 1} bytes"
+                )
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch_segment, range(0, size, segment)))
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️ Range download failed ({e}); retrying with a single request...")
+        return False
+    return True
 
 def download_json_data():
     """
@@ -13,22 +104,34 @@ def download_json_data():
         print("Downloading JSON data...")
         print(f"URL: {url}")
         
-        # Make the HTTP request
-        response = requests.get(url, timeout=30)
-        
-        # Check if request was successful
-        response.raise_for_status()
-        
-        # Parse JSON data
-        json_data = response.json()
-        
         # Create filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{timestamp}_products.json"
         
-        # Save to file
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(json_data, file, indent=2, ensure_ascii=False)
+        # Download into a temporary file and move it into place only once it
+        # is complete, so a failed transfer never leaves a truncated or
+        # zero-filled file under the final name
+        tmp_filename = filename + '.part'
+        try:
+            # Split large bodies across parallel Range requests when supported;
+            # otherwise stream the response body straight to disk instead of
+            # parsing and re-serializing it in memory
+            if not download_in_ranges(url, tmp_filename):
+                with _SESSION.get(url, stream=True, timeout=(5, 30)) as response:
+                    # Check if request was successful
+                    response.raise_for_status()
+                    
+                    # Let urllib3 decompress gzip/brotli chunks while copying
+                    response.raw.decode_content = True
+                    with open(tmp_filename, 'wb') as file:
+                        shutil.copyfileobj(response.raw, file, length=1 << 20)
+            os.replace(tmp_filename, filename)
+        except Exception:
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            raise
         
         # Get file size
         file_size = os.path.getsize(filename)
@@ -37,16 +140,12 @@ def download_json_data():
         print(f"✅ Success!")
         print(f"📁 File saved as: {filename}")
         print(f"📊 File size: {file_size_mb:.2f} MB ({file_size:,} bytes)")
-        print(f"📈 Records count: {len(json_data) if isinstance(json_data, list) else 'N/A'}")
         
         return filename
         
     except requests.exceptions.RequestException as e:
         print(f"❌ Network error occurred: {e}")
         return None
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON parsing error: {e}")
-        return None
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return None
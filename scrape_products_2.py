@@ -20,8 +20,9 @@ Key Features
   maintain authentication state.
 * Handles CSRF tokens or hidden form fields if present on the login
   page.
-* Implements a backoff mechanism with delays between requests to
-  avoid overwhelming the server.
+* Downloads images concurrently with a thread pool and processes a
+  few categories at a time, while capping the request rate to avoid
+  overwhelming the server.
 * Logs progress and warnings without halting execution when
   encountering missing images, timeouts or other recoverable errors.
 * Creates a clean folder structure under `output/` with one folder
@@ -32,8 +33,9 @@ Usage
 -----
 Run the script as a standalone program. No command line arguments
 are required because the category identifiers and login credentials
-are baked into the code for simplicity. Ensure that the `requests`
-and `beautifulsoup4` packages are installed in your environment.
+are baked into the code for simplicity. Ensure that the `requests`,
+`beautifulsoup4`, `lxml` and `orjson` packages are installed in your
+environment.
 
     python scrape_products.py
 
@@ -53,15 +55,19 @@ Limitations
   such categories.
 """
 
-import json
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple, TypedDict
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # -----------------------------------------------------------------------------
@@ -128,10 +134,44 @@ PRODUCTS_ENDPOINT_TEMPLATE: str = (
     BASE_API_URL + "/parts/get-parts/{category_id}"
 )
 
-
-@dataclass
-class Product:
-    """Represents a single product scraped from the API."""
+# Headers sent with login requests. A common browser User-Agent reduces the
+# likelihood of being blocked.
+LOGIN_HEADERS: Dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:98.0) Gecko/20100101 Firefox/98.0"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+# Where the login form's action URL and field defaults are remembered
+# between runs (never the credentials themselves).
+LOGIN_CACHE_PATH: str = os.path.join(os.path.expanduser("~"), ".cache", "jk_scrape", "login.json")
+
+# Concurrency limits. Images within a category are downloaded by a pool of
+# `IMAGE_WORKERS` threads and up to `CATEGORY_WORKERS` categories are
+# processed at once. `MAX_REQUESTS_PER_SECOND` caps the overall rate of
+# API and image requests so the extra concurrency stays polite to the
+# server.
+IMAGE_WORKERS: int = 8
+CATEGORY_WORKERS: int = 4
+MAX_REQUESTS_PER_SECOND: int = 10
+
+# Patterns used once per product, compiled at import time
+_SAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9_.-]")
+# Resolution suffix such as `_352x192` right before the file extension
+_RESOLUTION_RE = re.compile(r"_\d{2,5}x\d{2,5}(?=\.[A-Za-z]+$)")
+# Everything but digits and the decimal point in a price string
+_PRICE_CLEAN_RE = re.compile(r"[^0-9.]+")
+
+# Keys that may hold a product's image URL (or list of URLs), in priority order
+_IMAGE_KEYS = ("image", "images", "product_image", "image_url", "img")
+
+
+class Product(TypedDict):
+    """Represents a single product scraped from the API.
+
+    Products are plain dicts so the list can be serialized directly.
+    """
 
     id: str
     name: str
@@ -140,43 +180,152 @@ class Product:
     image: str  # Filename of the downloaded image
 
 
-def sanitize_filename(filename: str) -> str:
-    """Sanitize filenames to remove characters not allowed on most filesystems.
-
-    Args:
-        filename: The original filename extracted from the image URL.
+class RateLimiter:
+    """Thread-safe sliding-window limiter for outgoing requests.
 
-    Returns:
-        A sanitized filename safe for writing to disk.
+    At most `max_calls` calls to `acquire` return within any `period`
+    seconds; further callers block until the oldest call leaves the window.
     """
-    # Remove any query strings or fragments
-    filename = filename.split("?")[0]
-    # Remove path separators and strip leading/trailing whitespace
-    filename = os.path.basename(filename).strip()
-    # Replace spaces and invalid characters with underscores
-    filename = re.sub(r"[^A-Za-z0-9_.-]", "_", filename)
-    return filename
 
+    def __init__(self, max_calls: int, period: float = 1.0) -> None:
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another request may start."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(wait)
 
-def strip_resolution_suffix(url: str) -> str:
-    """Remove resolution suffix patterns (e.g. `_352x192`) from an image URL.
 
-    Many of the product image URLs include suffixes that denote a low
-    resolution version of the image. To download the high‑resolution
-    equivalent, we strip those suffixes before the file extension.
+# Shared by every worker thread so the cap applies to the whole run
+rate_limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def image_filename(url: str) -> Tuple[str, str]:
+    """Derive the high‑resolution URL and a safe local filename for an image.
+
+    Many of the product image URLs include suffixes (e.g. `_352x192`) that
+    denote a low resolution version of the image. The suffix is stripped
+    once, before the file extension, and the filename is derived from the
+    same stripped path, so the URL is only split and scanned a single time.
 
     Args:
         url: The URL of the image as provided by the API or product page.
 
     Returns:
-        The modified URL pointing to the high‑resolution image.
+        A tuple `(high_res_url, filename)`. The URL keeps any query string;
+        the filename has characters not allowed on most filesystems
+        replaced with underscores.
     """
     # Split URL into base and query components
     base, sep, query = url.partition("?")
     # Replace patterns like `_123x456` just before the extension
-    new_base = re.sub(r"_(\d{2,5}x\d{2,5})(?=\.[A-Za-z]+$)", "", base)
-    # Reassemble the URL, preserving query if present
-    return new_base + (sep + query if sep else "")
+    base = _RESOLUTION_RE.sub("", base)
+    # Remove path separators, then replace spaces and invalid characters
+    filename = _SAFE_CHARS_RE.sub("_", os.path.basename(base).strip())
+    return base + sep + query, filename
+
+
+def load_login_form() -> Optional[Dict]:
+    """Load the login form action and fields saved by a previous run.
+
+    Returns:
+        A dictionary with `action` and `fields`, or None if nothing usable
+        has been cached.
+    """
+    try:
+        with open(LOGIN_CACHE_PATH, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("action"), str)
+        and isinstance(cached.get("fields"), dict)
+    ):
+        return cached
+    return None
+
+
+def save_login_form(action: str, fields: Dict[str, str]) -> None:
+    """Remember the login form so later runs can skip fetching the page.
+
+    Only the form action and its field defaults are stored; the
+    credentials are filled in again on every run and never written.
+    """
+    try:
+        os.makedirs(os.path.dirname(LOGIN_CACHE_PATH), exist_ok=True)
+        with open(LOGIN_CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps({"action": action, "fields": fields}))
+    except OSError as exc:
+        print(f"Warning: Unable to cache login form: {exc}")
+
+
+def fill_credentials(fields: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of the login form fields with the credentials filled in.
+
+    Args:
+        fields: Input names and default values taken from the login form.
+
+    Returns:
+        The payload to submit.
+    """
+    payload = dict(fields)
+    # Fill in credentials based on input names
+    for key in list(payload.keys()):
+        lower_key = key.lower()
+        if "email" in lower_key or "username" in lower_key or "customer[email]" in lower_key:
+            payload[key] = EMAIL
+        elif "pass" in lower_key:
+            payload[key] = PASSWORD
+
+    # In case the form did not include fields for email or password, set them
+    if not any("email" in k.lower() or "username" in k.lower() for k in payload):
+        payload["email"] = EMAIL
+    if not any("pass" in k.lower() for k in payload):
+        payload["password"] = PASSWORD
+    return payload
+
+
+def submit_login(session: requests.Session, login_action_url: str, payload: Dict[str, str]) -> bool:
+    """Post the login form and check whether the site accepted it.
+
+    Args:
+        session: A `requests.Session` object used to persist cookies.
+        login_action_url: Absolute URL the form is submitted to.
+        payload: Form fields including the credentials.
+
+    Returns:
+        True if the response looks like a successful login. HTTP errors are
+        raised to the caller.
+    """
+    print(f"Submitting login form to {login_action_url}…")
+    post_resp = session.post(
+        login_action_url, headers=LOGIN_HEADERS, data=payload, timeout=20
+    )
+    post_resp.raise_for_status()
+
+    # Check for redirects (HTTP 301/302).  A successful login will often
+    # redirect to the account dashboard or home page.
+    if post_resp.history and post_resp.history[0].status_code in (301, 302):
+        print("Login redirects detected; assuming success.")
+        return True
+
+    # Check response text for markers of successful login
+    if "logout" in post_resp.text.lower() or "my account" in post_resp.text.lower():
+        print("Login successful.")
+        return True
+    return False
 
 
 def login(session: requests.Session) -> bool:
@@ -187,55 +336,48 @@ def login(session: requests.Session) -> bool:
     the user’s email and password. If additional hidden fields are present,
     they are passed through automatically.
 
+    After a successful login the form's action and fields are cached in
+    `LOGIN_CACHE_PATH`. Later runs post to the cached form directly and
+    only fetch and parse the login page if that attempt is rejected.
+
     Args:
         session: A `requests.Session` object used to persist cookies.
 
     Returns:
         True if login was successful, False otherwise.
     """
+    cached = load_login_form()
+    if cached:
+        try:
+            if submit_login(session, cached["action"], fill_credentials(cached["fields"])):
+                return True
+        except requests.exceptions.RequestException as exc:
+            print(f"Cached login form failed: {exc}")
+        print("Cached login form was not accepted; fetching the login page.")
+
     try:
         # Fetch the login page to obtain cookies and hidden fields
         print("Fetching login page…")
-        # Use a common browser User-Agent to reduce the likelihood of being blocked
-        default_headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:98.0) Gecko/20100101 Firefox/98.0"
-            ),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-        resp = session.get(LOGIN_URL, headers=default_headers, timeout=20)
+        resp = session.get(LOGIN_URL, headers=LOGIN_HEADERS, timeout=20)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Hand lxml the raw bytes so it detects the encoding itself
+        soup = BeautifulSoup(resp.content, "lxml")
 
         # Find the correct login form by searching for a form that contains a
         # password field. Some pages include multiple forms (e.g. search bar), so
         # picking the first form blindly can lead to submitting credentials to
-        # the wrong endpoint (such as /search).  We iterate over all forms and
-        # choose the first one that has an input whose type is "password" or
-        # whose name includes "pass".
-        forms = soup.find_all("form") or []
-        login_form = None
-        for frm in forms:
-            # Look for any password input inside the form
-            pw_field = frm.find("input", {"type": "password"})
-            if pw_field:
-                login_form = frm
-                break
-            # Alternatively, check input names for typical password keywords
-            for inp in frm.find_all("input"):
-                name_attr = inp.get("name", "").lower()
-                if "pass" in name_attr:
-                    login_form = frm
-                    break
-            if login_form:
-                break
+        # the wrong endpoint (such as /search).  We choose the first form that
+        # has an input whose type is "password" or whose name includes "pass".
+        login_form = soup.select_one(
+            'form:has(input[type="password"], input[name*="pass" i])'
+        )
 
         if login_form is None:
             print(
                 "Warning: No login form with a password field found; attempting to post credentials directly."
             )
             payload = {"Email": EMAIL, "Password": PASSWORD}
-            post_resp = session.post(LOGIN_URL, headers=default_headers, data=payload, timeout=20)
+            post_resp = session.post(LOGIN_URL, headers=LOGIN_HEADERS, data=payload, timeout=20)
             return post_resp.status_code == 200
 
         # Extract the form action; default to the current URL if missing
@@ -244,44 +386,17 @@ def login(session: requests.Session) -> bool:
             action if action.startswith("http") else requests.compat.urljoin(LOGIN_URL, action)
         )
 
-        # Prepare payload with all hidden inputs and default values
-        payload: Dict[str, str] = {}
+        # Collect all hidden inputs and default values
+        fields: Dict[str, str] = {}
         for input_elem in login_form.find_all("input"):
             name = input_elem.get("name")
             if not name:
                 continue
             value = input_elem.get("value", "")
-            payload[name] = value
-
-        # Fill in credentials based on input names
-        for key in list(payload.keys()):
-            lower_key = key.lower()
-            if "email" in lower_key or "username" in lower_key or "customer[email]" in lower_key:
-                payload[key] = EMAIL
-            elif "pass" in lower_key:
-                payload[key] = PASSWORD
-
-        # In case the form did not include fields for email or password, set them
-        if not any("email" in k.lower() or "username" in k.lower() for k in payload):
-            payload["email"] = EMAIL
-        if not any("pass" in k.lower() for k in payload):
-            payload["password"] = PASSWORD
-
-        print(f"Submitting login form to {login_action_url}…")
-        post_resp = session.post(
-            login_action_url, headers=default_headers, data=payload, timeout=20
-        )
-        post_resp.raise_for_status()
-
-        # Check for redirects (HTTP 301/302).  A successful login will often
-        # redirect to the account dashboard or home page.
-        if post_resp.history and post_resp.history[0].status_code in (301, 302):
-            print("Login redirects detected; assuming success.")
-            return True
+            fields[name] = value
 
-        # Check response text for markers of successful login
-        if "logout" in post_resp.text.lower() or "my account" in post_resp.text.lower():
-            print("Login successful.")
+        if submit_login(session, login_action_url, fill_credentials(fields)):
+            save_login_form(login_action_url, fields)
             return True
 
         print("Login may have failed; please verify credentials.")
@@ -316,11 +431,13 @@ def fetch_products(session: requests.Session, category_id: str) -> Optional[List
         "User-Agent": "Mozilla/5.0 (compatible; scrape_products/1.0)",
     }
     try:
+        rate_limiter.acquire()
         response = session.get(url, headers=headers, timeout=30)
         if response.status_code != 200:
             print(f"Warning: Failed to fetch products for category {category_id} (status {response.status_code}).")
             return None
-        data = response.json()
+        # Parse the raw bytes directly instead of decoding to str first
+        data = orjson.loads(response.content)
         # Some APIs wrap results in a 'data' or 'result' field; adjust as needed
         if isinstance(data, dict):
             # Try direct list
@@ -334,7 +451,7 @@ def fetch_products(session: requests.Session, category_id: str) -> Optional[List
             return data
         print(f"Warning: Unexpected response format for category {category_id}.")
         return None
-    except requests.exceptions.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Warning: Unable to decode JSON for category {category_id}.")
         return None
     except Exception as exc:
@@ -345,8 +462,10 @@ def fetch_products(session: requests.Session, category_id: str) -> Optional[List
 def download_image(session: requests.Session, url: str, dest_path: str) -> bool:
     """Download an image from a URL and save it to a destination path.
 
-    If the download fails (e.g. due to HTTP error or timeout), a
-    warning is logged and the function returns False.
+    A non-empty file already at `dest_path` is kept as is and no request
+    is made, which makes re-runs cheap. If the download fails (e.g. due
+    to HTTP error or timeout), a warning is logged and the function
+    returns False.
 
     Args:
         session: Authenticated `requests.Session` instance.
@@ -354,30 +473,119 @@ def download_image(session: requests.Session, url: str, dest_path: str) -> bool:
         dest_path: The full path on disk where the image will be saved.
 
     Returns:
-        True on success, False on failure.
+        True on success (or if the image is already on disk), False on
+        failure.
     """
+    if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
+        return True
+    # Stream into a temporary file so a failed transfer never leaves a
+    # truncated image behind under the final name, where later runs would
+    # take it for a finished download
+    tmp_path = dest_path + ".part"
     try:
-        resp = session.get(url, timeout=40)
-        resp.raise_for_status()
-        with open(dest_path, "wb") as f:
-            f.write(resp.content)
+        rate_limiter.acquire()
+        # Stream the body to disk in 64 KiB chunks rather than holding the
+        # whole image in memory
+        with session.get(url, timeout=40, stream=True) as resp:
+            resp.raise_for_status()
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                for chunk in resp.iter_content(chunk_size=65536):
+                    f.write(chunk)
+        os.replace(tmp_path, dest_path)
         return True
     except Exception as exc:
         print(f"Warning: Failed to download image {url}: {exc}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
-def process_category(session: requests.Session, category_id: str) -> None:
+def parse_product(product: Dict) -> Tuple[Product, str]:
+    """Turn one API product record into a `Product` and its image URL.
+
+    Args:
+        product: The raw product dictionary returned by the API.
+
+    Returns:
+        A tuple `(Product, image_url)`. The product's `image` holds the
+        filename the image will be saved under; both are empty if the
+        record has no image.
+    """
+    # Extract basic fields with fallbacks
+    pid = str(product.get("id") or product.get("_id") or "")
+    name = str(product.get("name") or product.get("title") or product.get("product_name") or "").strip()
+    description = str(product.get("description") or product.get("desc") or product.get("product_description") or "").strip()
+    price_raw = product.get("price") or product.get("product_price")
+    if price_raw is None:
+        price = None
+    elif isinstance(price_raw, (int, float)):
+        # Numeric prices are the common case and need no parsing
+        price = float(price_raw)
+    else:
+        try:
+            price = float(price_raw)
+        except (TypeError, ValueError):
+            # Strip non‑numeric characters and try again
+            cleaned = _PRICE_CLEAN_RE.sub("", str(price_raw))
+            try:
+                price = float(cleaned) if cleaned else None
+            except ValueError:
+                price = None
+
+    # Determine image URL from the first non-empty typical key; some APIs
+    # may return a list of images
+    image_val = next((product[key] for key in _IMAGE_KEYS if product.get(key)), None)
+    image_url = image_val[0] if isinstance(image_val, list) else image_val
+
+    if not image_url:
+        print(f"Warning: No image found for product {pid} ({name}); skipping image download.")
+        high_res_url = ""
+        filename = ""
+    else:
+        # Strip resolution suffix and derive the filename from the URL
+        high_res_url, filename = image_filename(str(image_url))
+
+    return Product(id=pid, name=name, price=price, description=description, image=filename), high_res_url
+
+
+def write_products_json(json_path: str, products_list: List[Product]) -> None:
+    """Serialize a category's products and write them to `json_path`.
+
+    Runs on the disk pool, so failures are reported here rather than
+    raised back to the scraping thread.
+
+    Args:
+        json_path: Destination of the `products.json` file.
+        products_list: Products to write, in API order.
+    """
+    try:
+        with open(json_path, "wb") as f:
+            # orjson encodes straight to UTF-8 bytes, keeping non-ASCII text as is
+            f.write(
+                orjson.dumps(products_list, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        print(f"Wrote {len(products_list)} products to {json_path}")
+    except Exception as exc:
+        print(f"Warning: Failed to write {json_path}: {exc}")
+
+
+def process_category(
+    session: requests.Session, category_id: str, disk_pool: ThreadPoolExecutor
+) -> None:
     """Process a single category: fetch products, download images and write JSON.
 
     This function coordinates all steps needed for a category: it calls
     the API to retrieve product details, creates a dedicated output
-    directory, downloads high‑resolution images, and writes the
-    `products.json` file.
+    directory, downloads high‑resolution images concurrently, and hands
+    the `products.json` write to `disk_pool` so the next category's
+    requests are not held up by disk I/O.
 
     Args:
         session: Authenticated `requests.Session` instance.
         category_id: The unique identifier for the cabinet category.
+        disk_pool: Executor used for writing `products.json`.
     """
     print(f"\nScraping category: {category_id}…")
     products_data = fetch_products(session, category_id)
@@ -389,85 +597,81 @@ def process_category(session: requests.Session, category_id: str) -> None:
     category_folder = os.path.join("output", category_id)
     os.makedirs(category_folder, exist_ok=True)
 
-    products_list: List[Product] = []
-
-    for product in products_data:
-        # Extract basic fields with fallbacks
-        pid = str(product.get("id") or product.get("_id") or "")
-        name = str(product.get("name") or product.get("title") or product.get("product_name") or "").strip()
-        description = str(product.get("description") or product.get("desc") or product.get("product_description") or "").strip()
-        price_raw = product.get("price") or product.get("product_price")
-        try:
-            price = float(price_raw) if price_raw is not None else None
-        except (TypeError, ValueError):
-            # Strip non‑numeric characters and try again
-            cleaned = re.sub(r"[^0-9.]+", "", str(price_raw))
-            try:
-                price = float(cleaned) if cleaned else None
-            except ValueError:
-                price = None
-
-        # Determine image URL; some APIs may return a list of images
-        image_url = None
-        # Try typical keys
-        for key in ("image", "images", "product_image", "image_url", "img"):
-            if key in product and product[key]:
-                if isinstance(product[key], list) and product[key]:
-                    image_url = product[key][0]
-                else:
-                    image_url = product[key]
-                break
-
-        if not image_url:
-            print(f"Warning: No image found for product {pid} ({name}); skipping image download.")
-            filename = ""
-        else:
-            # Strip resolution suffix from the URL
-            high_res_url = strip_resolution_suffix(str(image_url))
-            # Determine file extension from URL
-            parsed_name = sanitize_filename(high_res_url)
-            # If the filename still contains resolution, remove again for safety
-            parsed_name = re.sub(r"_\d{2,5}x\d{2,5}(?=\.[A-Za-z]+$)", "", parsed_name)
-            dest_file_path = os.path.join(category_folder, parsed_name)
-            # Download the image
-            success = download_image(session, high_res_url, dest_file_path)
-            if success:
-                filename = parsed_name
-            else:
-                filename = ""
-
-        products_list.append(Product(id=pid, name=name, price=price, description=description, image=filename))
-
-        # Respectful delay between product downloads
-        time.sleep(1)
-
-    # Write products.json
+    parsed = [parse_product(product) for product in products_data]
+    products_list: List[Product] = [product for product, _ in parsed]
+
+    # Many products share an image, so download each distinct URL once.
+    # Downloads are I/O bound and run on a thread pool.
+    filenames: Dict[str, str] = {}
+    for product, image_url in parsed:
+        if image_url:
+            filenames.setdefault(image_url, product["image"])
+    # Different URLs can still map to one filename (e.g. only the ?v= query
+    # differs), so each destination file gets a single download and two
+    # threads never write the same path
+    sources: Dict[str, str] = {}
+    for url, filename in filenames.items():
+        sources.setdefault(filename, url)
+
+    # List the folder once instead of checking every image path. Images only
+    # reach their final name through an atomic rename once complete, so any
+    # file already there is kept without a request; is_file() is answered
+    # from the directory listing without a stat() per entry.
+    with os.scandir(category_folder) as entries:
+        existing = {entry.name for entry in entries if entry.is_file()}
+    downloaded = {filename: True for filename in sources if filename in existing}
+    pending = [filename for filename in sources if filename not in downloaded]
+    category_prefix = category_folder + os.sep
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as executor:
+        downloaded.update(zip(pending, executor.map(
+            lambda filename: download_image(session, sources[filename], category_prefix + filename),
+            pending,
+        )))
+    for product, image_url in parsed:
+        if image_url and not downloaded[filenames[image_url]]:
+            product["image"] = ""
+
+    # Write products.json in the background
     json_path = os.path.join(category_folder, "products.json")
-    try:
-        with open(json_path, "w", encoding="utf-8") as f:
-            # Convert dataclass objects to dicts
-            json.dump([p.__dict__ for p in products_list], f, ensure_ascii=False, indent=2)
-        print(f"Wrote {len(products_list)} products to {json_path}")
-    except Exception as exc:
-        print(f"Warning: Failed to write JSON for category {category_id}: {exc}")
+    disk_pool.submit(write_products_json, json_path, products_list)
 
 
 def main() -> None:
     """Main entry point for the scraping script."""
     with requests.Session() as session:
+        # Size the connection pool for all concurrent workers so keep-alive
+        # connections are reused instead of discarded, and let urllib3 retry
+        # transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         # Authenticate with the site
         logged_in = login(session)
         if not logged_in:
             print("Failed to log in. Scraping cannot proceed without authentication.")
             return
-        # Iterate through all categories
-        for cid in CATEGORY_IDS:
+        # Process several categories at once; the shared session is safe to
+        # use from multiple threads
+        def run_category(cid: str) -> None:
             try:
-                process_category(session, cid)
+                process_category(session, cid, disk_pool)
             except Exception as exc:
                 print(f"Error processing category {cid}: {exc}")
-            # Add a delay between categories
-            time.sleep(2)
+
+        # products.json files are written off the request threads; leaving
+        # the `with` block waits for every pending write
+        with ThreadPoolExecutor(max_workers=2) as disk_pool:
+            with ThreadPoolExecutor(max_workers=CATEGORY_WORKERS) as executor:
+                list(executor.map(run_category, CATEGORY_IDS))
 
 
 if __name__ == "__main__":
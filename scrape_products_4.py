@@ -39,18 +39,18 @@ Key features
 * **Graceful error handling** – Network timeouts, HTML parsing
   irregularities and missing elements are handled gracefully. The
   scraper logs warnings and continues processing without aborting
-  entirely. Delays are inserted between requests to reduce the risk
-  of being rate limited.
+  entirely. All network requests share a token-bucket rate limiter to
+  reduce the risk of being rate limited.
 
 Usage
 -----
 
 To run the scraper, simply execute this file with Python 3. It
-requires the ``requests`` and ``beautifulsoup4`` packages. The
-credentials provided by the user are optional: many product pages are
-publicly visible without logging in. However, if certain details are
-hidden behind authentication, the script will attempt to log in using
-the supplied email and password.
+requires the ``requests``, ``beautifulsoup4``, ``lxml`` and ``orjson``
+packages. The credentials provided by the user are optional: many
+product pages are publicly visible without logging in. However, if
+certain details are hidden behind authentication, the script will
+attempt to log in using the supplied email and password.
 
     python scrape_products_3.py
 
@@ -74,15 +74,23 @@ Limitations
   authentication challenges such as CAPTCHAs or multifactor prompts.
 """
 
-import json
 import os
 import re
+import shutil
+import threading
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
 import html  # Added to unescape HTML entities in Shopify JSON blobs
 
 
@@ -152,8 +160,97 @@ CATEGORY_MAPPING: List[Dict[str, str]] = [
     {"id": "689d87ceca19d8fef712c799", "name": "Roll-Out Trays", "slug": "roll-out-trays"},
 ]
 
+# Number of product pages fetched and parsed concurrently. This also
+# bounds how many product requests the scraper has in flight at once.
+PRODUCT_WORKERS: int = 8
 
-@dataclass
+# Number of images downloaded concurrently per category
+IMAGE_WORKERS: int = 8
+
+# Number of categories scraped at once. Each category runs its own product
+# and image pools, so the session's connection pool is sized for all of them.
+CATEGORY_WORKERS: int = 4
+
+# Average request rate across all workers, and how many requests may be
+# sent back to back after an idle spell
+MAX_REQUESTS_PER_SECOND: float = 8.0
+REQUEST_BURST: int = 8
+
+# On-disk cache for collection and product pages, used when the optional
+# ``requests-cache`` package is installed. Re-runs within HTTP_CACHE_EXPIRE
+# read unchanged pages from disk instead of fetching them again. Set
+# HTTP_CACHE_NAME to None to always fetch live pages.
+HTTP_CACHE_NAME: Optional[str] = "jk_cache"
+HTTP_CACHE_EXPIRE: timedelta = timedelta(hours=24)
+
+# Headers sent with every request. They are set on the session once so
+# individual calls don't rebuild them.
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    " AppleWebKit/537.36 (KHTML, like Gecko)"
+    " Chrome/122.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+
+# -----------------------------------------------------------------------------
+# Precompiled regular expressions
+#
+# These run for every product and URL, so they are compiled once here.
+
+# Characters that are unsafe in a filename
+_RE_SAFE = re.compile(r"[^A-Za-z0-9_.-]")
+# Shopify resolution suffix before the file extension, e.g. ``_600x600``
+_RE_RES = re.compile(r"_(\d{2,5}x\d{2,5})(?=\.[A-Za-z]+$)")
+# Product ID at the start of a title, e.g. ``S8/SB30``
+_RE_PID = re.compile(r"([A-Za-z0-9]+/[A-Za-z0-9]+)")
+# Anything in a price string that isn't part of the number
+_RE_PRICE_CLEAN = re.compile(r"[^0-9.]+")
+# Query string or fragment of a product URL, ignored when deduplicating
+_RE_KEY = re.compile(r"[?#].*$")
+
+
+# -----------------------------------------------------------------------------
+# Precompiled XPath queries
+#
+# Collection and product pages are parsed with lxml directly; these queries
+# are compiled once and evaluated in C for every page.
+
+
+def _has_class(name: str) -> str:
+    """Return an XPath predicate matching elements with CSS class ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Text nodes of an element as BeautifulSoup's ``get_text`` sees them
+_XP_TEXT = XPath("descendant::text()[not(ancestor::script) and not(ancestor::style)]")
+# First link inside an element
+_XP_FIRST_HREF = XPath("descendant::a[@href][1]/@href")
+# Shopify analytics blobs embedded in script tags
+_XP_DATA_EVENTS = XPath("//script[@data-events]/@data-events")
+# First link of every product card on a collection page: general grid
+# items and the older theme's product cards, as <div> or <li> elements
+_XP_CARDS = XPath(
+    f"(//*[self::div or self::li][{_has_class('grid__item')} or {_has_class('product-card')}])"
+    "/descendant::a[@href][1]/@href"
+)
+# Any element whose class mentions 'product' (last-resort card lookup)
+_XP_PRODUCT_ELEMENTS = XPath("//*[contains(@class, 'product')]")
+_XP_H1 = XPath("(//h1)[1]")
+_XP_PRICE = XPath("(//*[contains(@class, 'price')])[1]")
+# Product description containers, tried in order
+_XP_DESCRIPTIONS: Tuple[XPath, ...] = (
+    XPath(f"(//div[{_has_class('product-description')}])[1]"),
+    XPath("(//div[@id='ProductDescription'])[1]"),
+    XPath("(//div[@id='product_description'])[1]"),
+    XPath("(//div[@itemprop='description'])[1]"),
+)
+_XP_META_DESCRIPTION = XPath("(//meta[@name='description'])[1]")
+_XP_OG_IMAGE = XPath("(//meta[@property='og:image'])[1]")
+_XP_FIRST_IMG = XPath("(//img[@src])[1]")
+
+
+@dataclass(slots=True, frozen=True)
 class Product:
     """Represents a single product scraped from the J&K Cabinetry website."""
 
@@ -164,6 +261,52 @@ class Product:
     image: str  # local filename of the downloaded high‑resolution image
 
 
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of outgoing requests.
+
+    Tokens refill at ``rate`` per second up to ``capacity``; each call to
+    ``acquire`` takes one and blocks while the bucket is empty. Short bursts
+    go out immediately while the long-run average stays at ``rate``.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another request may start."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every worker thread so the cap applies to the whole run
+rate_limiter = TokenBucket(MAX_REQUESTS_PER_SECOND, REQUEST_BURST)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that takes a token from ``rate_limiter`` per request.
+
+    Throttling at the transport means only requests that actually go out
+    are limited: pages a ``CachedSession`` answers from its on-disk cache
+    never reach the adapter and are returned immediately.
+    """
+
+    def send(self, request, **kwargs):
+        rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filenames to remove characters unsafe for filesystems.
 
@@ -178,7 +321,7 @@ def sanitize_filename(filename: str) -> str:
     # Use basename to discard any path
     filename = os.path.basename(filename)
     # Replace disallowed characters with underscores
-    filename = re.sub(r"[^A-Za-z0-9_.-]", "_", filename)
+    filename = _RE_SAFE.sub("_", filename)
     return filename
 
 
@@ -199,7 +342,7 @@ def strip_resolution_suffix(url: str) -> str:
     # Separate URL into base and query
     base, sep, query = url.partition("?")
     # Remove patterns like _123x456 before the file extension
-    new_base = re.sub(r"_(\d{2,5}x\d{2,5})(?=\.[A-Za-z]+$)", "", base)
+    new_base = _RE_RES.sub("", base)
     return new_base + (sep + query if sep else "")
 
 
@@ -221,14 +364,8 @@ def login(session: requests.Session) -> bool:
         True if login appears to be successful, False otherwise.
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            " AppleWebKit/537.36 (KHTML, like Gecko)"
-            " Chrome/122.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
         print("Fetching login page…")
-        resp = session.get(f"{BASE_URL}/account/login", headers=headers, timeout=20)
+        resp = session.get(f"{BASE_URL}/account/login", timeout=20)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
         # Find form containing a password input
@@ -265,7 +402,7 @@ def login(session: requests.Session) -> bool:
         if not inserted_password:
             payload["password"] = PASSWORD
         print(f"Submitting login credentials to {login_url}…")
-        post_resp = session.post(login_url, headers=headers, data=payload, timeout=20)
+        post_resp = session.post(login_url, data=payload, timeout=20)
         # A successful login may cause a redirect
         if post_resp.history and any(r.status_code in (301, 302) for r in post_resp.history):
             print("Login redirect detected; assuming success.")
@@ -280,53 +417,39 @@ def login(session: requests.Session) -> bool:
         return False
 
 
-def get_soup(session: requests.Session, url: str) -> Optional[BeautifulSoup]:
-    """Fetch a URL and return a BeautifulSoup object on success.
+def get_tree(session: requests.Session, url: str) -> Optional[lxml_html.HtmlElement]:
+    """Fetch a URL and return its parsed lxml document on success.
 
     Args:
         session: ``requests.Session`` used for persistent connections.
         url: The URL to fetch.
 
     Returns:
-        A BeautifulSoup instance if the request succeeds (HTTP 200) and the
+        The root ``HtmlElement`` if the request succeeds (HTTP 200) and the
         content is HTML; otherwise ``None``.
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            " AppleWebKit/537.36 (KHTML, like Gecko)"
-            " Chrome/122.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-        response = session.get(url, headers=headers, timeout=30)
+        response = session.get(url, timeout=30)
         if response.status_code != 200:
             return None
-        return BeautifulSoup(response.text, "html.parser")
+        # Decode with the charset from the Content-Type header when the server
+        # sends one. Otherwise requests only guesses ISO-8859-1 for text/*, so
+        # leave the encoding to lxml, which honours <meta charset>.
+        content_type = response.headers.get("Content-Type", "")
+        encoding = response.encoding if "charset" in content_type.lower() else None
+        parser = lxml_html.HTMLParser(encoding=encoding)
+        return lxml_html.fromstring(response.content, parser=parser)
     except Exception:
         return None
 
 
-def parse_product_card(card: BeautifulSoup) -> Optional[str]:
-    """Extract the product page URL from a product card element.
-
-    Each collection page lists products as cards or grid items. This
-    helper takes a card (e.g. a `<div>` or `<li>` element) and finds the
-    anchor pointing to the product page. It returns a relative URL or
-    full URL, depending on what the page contains.
+def element_text(elem: lxml_html.HtmlElement, separator: str = "") -> str:
+    """Return the text of ``elem`` with every string stripped and joined.
 
-    Args:
-        card: A BeautifulSoup element representing a product.
-
-    Returns:
-        The product URL if found, else ``None``.
+    Matches ``BeautifulSoup.get_text(separator, strip=True)``: script and
+    style contents are skipped and empty strings are dropped.
     """
-    # Look for an <a> tag that links to a product. Often it's the first
-    # anchor within the card.
-    link = card.find("a", href=True)
-    if not link:
-        return None
-    href = link["href"]
-    return href.strip()
+    return separator.join(t.strip() for t in _XP_TEXT(elem) if t.strip())
 
 
 def parse_collection_page(session: requests.Session, collection_url: str) -> List[str]:
@@ -339,8 +462,8 @@ def parse_collection_page(session: requests.Session, collection_url: str) -> Lis
     Returns:
         A list of relative or absolute product URLs extracted from the page.
     """
-    soup = get_soup(session, collection_url)
-    if soup is None:
+    tree = get_tree(session, collection_url)
+    if tree is None:
         return []
     product_urls: List[str] = []
     # First attempt: extract product URLs from Shopify's data-events JSON embedded
@@ -348,15 +471,15 @@ def parse_collection_page(session: requests.Session, collection_url: str) -> Lis
     # rendered client side. The script tag looks like:
     # <script ... data-events="[[&quot;page_viewed&quot;,{}],[&quot;collection_viewed&quot;,{...productVariants...}]]" ...></script>
     try:
-        scripts = soup.find_all('script', attrs={'data-events': True})
-        for s in scripts:
-            raw_events = s.get('data-events')
-            if not raw_events:
+        for raw_events in _XP_DATA_EVENTS(tree):
+            # Only the collection_viewed event carries product URLs; skip
+            # other analytics blobs without decoding them
+            if not raw_events or "collection_viewed" not in raw_events:
                 continue
             # Unescape HTML entities (&quot; -> ")
             decoded = html.unescape(raw_events)
             # Parse JSON
-            events = json.loads(decoded)
+            events = orjson.loads(decoded)
             # events is expected to be a list like [["page_viewed",{}], ["collection_viewed", {...}]]
             for ev in events:
                 if isinstance(ev, list) and len(ev) == 2 and ev[0] == 'collection_viewed':
@@ -381,30 +504,19 @@ def parse_collection_page(session: requests.Session, collection_url: str) -> Lis
         product_urls = []
     # Fallback: parse HTML elements if JSON extraction fails
     if not product_urls:
-        selectors = [
-            "div.grid__item",  # general grid items
-            "div.product-card",  # older theme
-            "li.grid__item",
-            "li.product-card",
-        ]
-        cards: List[BeautifulSoup] = []
-        for sel in selectors:
-            cards = soup.select(sel)
-            if cards:
-                break
-        if not cards:
+        # One pass over the tree collects the link of every card
+        for href in _XP_CARDS(tree):
+            href = href.strip()
+            if href:
+                product_urls.append(href)
+        if not product_urls:
             # As a last resort, look for any anchor tags within elements whose
             # class contains the word 'product'. This may capture items on
             # unpredictable themes.
-            for elem in soup.find_all(True, class_=re.compile("product")):
-                anchor = elem.find("a", href=True)
-                if anchor and anchor['href']:
-                    product_urls.append(anchor['href'].strip())
-            return product_urls
-        for card in cards:
-            url = parse_product_card(card)
-            if url:
-                product_urls.append(url)
+            for elem in _XP_PRODUCT_ELEMENTS(tree):
+                hrefs = _XP_FIRST_HREF(elem)
+                if hrefs and hrefs[0]:
+                    product_urls.append(hrefs[0].strip())
     return product_urls
 
 
@@ -423,24 +535,24 @@ def parse_product_page(session: requests.Session, product_url: str) -> Optional[
     # Normalize product URL
     if not product_url.startswith("http"):
         product_url = requests.compat.urljoin(BASE_URL, product_url)
-    soup = get_soup(session, product_url)
-    if soup is None:
+    tree = get_tree(session, product_url)
+    if tree is None:
         return None
     try:
         # Extract product title. J&K uses <h1 class="product-title"> or
         # <h1 itemprop="name">. We'll try multiple selectors.
-        title_elem = soup.find("h1")
-        title = title_elem.get_text(strip=True) if title_elem else ""
+        title_elems = _XP_H1(tree)
+        title = element_text(title_elems[0]) if title_elems else ""
         # Product ID can often be the first token in the title (e.g. "S8/SB30").
-        product_id_match = re.search(r"([A-Za-z0-9]+/[A-Za-z0-9]+)", title)
+        product_id_match = _RE_PID.search(title)
         product_id = product_id_match.group(1) if product_id_match else title
         # Price: look for elements containing currency signs
         price = None
-        price_elem = soup.find(class_=re.compile("price"))
-        if price_elem:
-            price_text = price_elem.get_text(strip=True)
+        price_elems = _XP_PRICE(tree)
+        if price_elems:
+            price_text = element_text(price_elems[0])
             # Remove currency symbols and commas
-            cleaned = re.sub(r"[^0-9.]+", "", price_text)
+            cleaned = _RE_PRICE_CLEAN.sub("", price_text)
             if cleaned:
                 try:
                     price = float(cleaned)
@@ -449,41 +561,33 @@ def parse_product_page(session: requests.Session, product_url: str) -> Optional[
         # Description: look for product description containers
         desc = ""
         # Try multiple possible containers for description
-        desc_selectors = [
-            "div.product-description",
-            "div#ProductDescription",
-            "div#product_description",
-            "div[itemprop='description']",
-        ]
-        for sel in desc_selectors:
-            desc_elem = soup.select_one(sel)
-            if desc_elem:
-                desc = desc_elem.get_text(" ", strip=True)
+        for xp_desc in _XP_DESCRIPTIONS:
+            desc_elems = xp_desc(tree)
+            if desc_elems:
+                desc = element_text(desc_elems[0], " ")
                 break
         if not desc:
             # Fallback: take the meta description
-            meta_desc = soup.find("meta", attrs={"name": "description"})
+            meta_desc = _XP_META_DESCRIPTION(tree)
             if meta_desc:
-                desc = meta_desc.get("content", "").strip()
+                desc = meta_desc[0].get("content", "").strip()
         # Image: use og:image meta tag as a reliable source
         image_url = ""
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            image_url = og_image["content"].strip()
+        og_image = _XP_OG_IMAGE(tree)
+        if og_image and og_image[0].get("content"):
+            image_url = og_image[0].get("content").strip()
         else:
             # Try to locate the first <img> within a gallery or image wrapper
-            img_elem = soup.find("img", src=True)
-            if img_elem:
-                image_url = img_elem["src"].strip()
+            img_elems = _XP_FIRST_IMG(tree)
+            if img_elems:
+                image_url = img_elems[0].get("src").strip()
         if not image_url:
             # If no image found, return without raising
             return None
         # Strip resolution suffix for high‑resolution
         high_res_url = strip_resolution_suffix(image_url)
-        # Derive image filename
+        # Derive image filename; the suffix is already gone from the URL
         filename = sanitize_filename(high_res_url)
-        # Remove any remaining resolution suffixes in filename
-        filename = re.sub(r"_\d{2,5}x\d{2,5}(?=\.[A-Za-z]+$)", "", filename)
         product = Product(
             id=product_id,
             name=title,
@@ -496,6 +600,38 @@ def parse_product_page(session: requests.Session, product_url: str) -> Optional[
         return None
 
 
+def make_session() -> requests.Session:
+    """Create the HTTP session, backed by an on-disk page cache if available.
+
+    Only collection and product pages are cached; the login page, the
+    login POST and image downloads always go to the network.
+
+    Returns:
+        A ``requests_cache.CachedSession`` when ``HTTP_CACHE_NAME`` is set
+        and ``requests-cache`` is installed, otherwise a plain
+        ``requests.Session``.
+    """
+    if HTTP_CACHE_NAME:
+        try:
+            from requests_cache import DO_NOT_CACHE, CachedSession
+        except ImportError:
+            print("requests-cache is not installed; pages will not be cached.")
+        else:
+            host = BASE_URL.split("://", 1)[1]
+            return CachedSession(
+                HTTP_CACHE_NAME,
+                backend="sqlite",
+                allowable_codes=(200,),
+                stale_if_error=True,
+                urls_expire_after={
+                    f"{host}/collections/*": HTTP_CACHE_EXPIRE,
+                    f"{host}/products/*": HTTP_CACHE_EXPIRE,
+                    "*": DO_NOT_CACHE,
+                },
+            )
+    return requests.Session()
+
+
 def download_image(session: requests.Session, url: str, dest_path: str) -> bool:
     """Download an image and save it to ``dest_path``.
 
@@ -507,19 +643,24 @@ def download_image(session: requests.Session, url: str, dest_path: str) -> bool:
     Returns:
         True if the download succeeded, False otherwise.
     """
+    # Stream into a temporary file so a failed transfer never leaves a
+    # truncated image behind under the final name
+    tmp_path = dest_path + ".part"
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-            " AppleWebKit/537.36 (KHTML, like Gecko)"
-            " Chrome/122.0 Safari/537.36",
-        }
-        resp = session.get(url, headers=headers, timeout=40)
-        resp.raise_for_status()
-        with open(dest_path, "wb") as f:
-            f.write(resp.content)
+        with session.get(url, timeout=40, stream=True) as resp:
+            resp.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding
+            resp.raw.decode_content = True
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(resp.raw, f, length=64 * 1024)
+        os.replace(tmp_path, dest_path)
         return True
     except Exception as exc:
         print(f"Warning: Failed to download image {url}: {exc}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -546,62 +687,82 @@ def process_category(session: requests.Session, category: Dict[str, str]) -> Non
     os.makedirs(category_folder, exist_ok=True)
     # Use a dict to avoid duplicate products across styles
     collected: Dict[str, Product] = {}
-    for style in STYLE_CODES:
-        # Build base collection URL (without page param)
-        base_collection = f"{BASE_URL}/collections/{style}-{slug}"
-        # Track product URLs we've seen for this style to detect when
-        # pagination repeats. Without this check, some collections may
-        # return the same items on every page, leading to an infinite loop.
-        seen_links: Set[str] = set()
-        page = 1
-        max_pages = 20  # fail safe to prevent infinite loops
-        while page <= max_pages:
-            url = base_collection if page == 1 else f"{base_collection}?page={page}"
-            # Fetch product URLs on this page
-            product_links = parse_collection_page(session, url)
-            if not product_links:
-                # No products found on this page – either the style
-                # doesn't offer this category or we've reached the end of
-                # pagination.
-                break
-            # Filter out links we've already processed for this style
-            new_links = []
-            for link in product_links:
-                # Normalize to absolute URL
-                full_url = link if link.startswith("http") else requests.compat.urljoin(BASE_URL, link)
-                # Remove query params and fragments for deduplication
-                key = re.sub(r"[/?#].*$", "", full_url)
-                if key not in seen_links:
-                    seen_links.add(key)
-                    new_links.append(full_url)
-            # If no new links were found, break to avoid cycling
-            if not new_links:
-                break
-            for full_url in new_links:
-                # Skip if we've already collected this product across styles
-                key = re.sub(r"[/?#].*$", "", full_url)
-                if key in collected:
-                    continue
-                # Parse product page
-                result = parse_product_page(session, full_url)
-                if not result:
-                    continue
-                product, img_url = result
-                # Download the image
-                dest_img_path = os.path.join(category_folder, product.image)
-                if product.image and not os.path.exists(dest_img_path):
-                    download_image(session, img_url, dest_img_path)
-                # Add to collection
-                collected[key] = product
-                time.sleep(1)  # polite delay between product requests
-            # Proceed to next page
-            page += 1
-            time.sleep(1)  # delay between pages
+    # Image filenames already on disk or handed to the download pool. One
+    # directory scan replaces a stat() call per product.
+    with os.scandir(category_folder) as it:
+        known_images: Set[str] = {entry.name for entry in it if entry.is_file()}
+    # Product pages are independent, so they are fetched and parsed on a
+    # thread pool sharing the session. Images download on a second pool in
+    # the background; leaving the ``with`` block waits for the last of them.
+    with ThreadPoolExecutor(max_workers=PRODUCT_WORKERS) as executor, \
+            ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as image_pool:
+        for style in STYLE_CODES:
+            # Build base collection URL (without page param)
+            base_collection = f"{BASE_URL}/collections/{style}-{slug}"
+            # Track product URLs we've seen for this style to detect when
+            # pagination repeats. Without this check, some collections may
+            # return the same items on every page, leading to an infinite loop.
+            seen_links: Set[str] = set()
+            page = 1
+            max_pages = 20  # fail safe to prevent infinite loops
+            while page <= max_pages:
+                url = base_collection if page == 1 else f"{base_collection}?page={page}"
+                # Fetch product URLs on this page
+                product_links = parse_collection_page(session, url)
+                if not product_links:
+                    # No products found on this page – either the style
+                    # doesn't offer this category or we've reached the end of
+                    # pagination.
+                    break
+                # Filter out links we've already processed for this style
+                new_links: List[Tuple[str, str]] = []
+                for link in product_links:
+                    # Normalize to absolute URL
+                    full_url = link if link.startswith("http") else requests.compat.urljoin(BASE_URL, link)
+                    # Remove query params and fragments for deduplication
+                    key = _RE_KEY.sub("", full_url)
+                    if key not in seen_links:
+                        seen_links.add(key)
+                        new_links.append((key, full_url))
+                # If no new links were found, break to avoid cycling
+                if not new_links:
+                    break
+                # Skip products we've already collected across styles
+                pending = []
+                for key, full_url in new_links:
+                    if key not in collected:
+                        pending.append((key, full_url))
+                # Parse the remaining product pages concurrently; results come
+                # back in link order
+                results = executor.map(
+                    lambda full_url: parse_product_page(session, full_url),
+                    [full_url for _, full_url in pending],
+                )
+                for (key, _), result in zip(pending, results):
+                    if not result:
+                        continue
+                    product, img_url = result
+                    # Queue the image download
+                    if product.image and product.image not in known_images:
+                        known_images.add(product.image)
+                        dest_img_path = os.path.join(category_folder, product.image)
+                        image_pool.submit(download_image, session, img_url, dest_img_path)
+                    # Add to collection
+                    collected[key] = product
+                # Proceed to next page
+                page += 1
     # Write JSON file
     json_path = os.path.join(category_folder, "products.json")
     try:
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump([asdict(prod) for prod in collected.values()], f, ensure_ascii=False, indent=2)
+        # orjson serialises the dataclasses natively and encodes straight to
+        # UTF-8 bytes, keeping non-ASCII text as is
+        with open(json_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    list(collected.values()),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
         print(f"Finished {category['name']}: {len(collected)} products saved to {json_path}")
     except Exception as exc:
         print(f"Warning: Failed to write products.json for {cid}: {exc}")
@@ -611,20 +772,33 @@ def main() -> None:
     """Main entry point for the scraper."""
     # Prepare output directory
     os.makedirs("output", exist_ok=True)
-    with requests.Session() as session:
+    with make_session() as session:
+        # Keep enough pooled connections for the product workers so they are
+        # reused instead of renegotiated, retry throttled or failed requests,
+        # and rate-limit everything that goes out over the network
+        adapter = RateLimitedAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
         # Perform login if credentials are provided
         if EMAIL and PASSWORD:
             logged_in = login(session)
             if not logged_in:
                 print("Continuing without login – some prices may be hidden.")
-        # Iterate through each category
-        for category in CATEGORY_MAPPING:
+        # Categories are independent, so several are scraped at once over
+        # the shared session
+        def run_category(category: Dict[str, str]) -> None:
             try:
                 process_category(session, category)
             except Exception as exc:
                 print(f"Error processing category {category['id']}: {exc}")
-            # Pause between categories
-            time.sleep(2)
+
+        with ThreadPoolExecutor(max_workers=CATEGORY_WORKERS) as executor:
+            list(executor.map(run_category, CATEGORY_MAPPING))
 
 
 if __name__ == "__main__":